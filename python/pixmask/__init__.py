@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import io
+import stat
+import sys
 import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Union
-
-import numpy as np
+from typing import TYPE_CHECKING, Sequence, Union
 
 from pixmask._version import __version__
 
+# numpy is imported on first use rather than here: it dominates
+# ``import pixmask`` time and is not needed until an image is processed.
+if TYPE_CHECKING:
+    import numpy as np
+
 # Lazy import — the C++ extension may not be installed in dev mode.
 try:
+    from pixmask.pixmask_ext import sanitize_array as _sanitize_array
+    from pixmask.pixmask_ext import sanitize_batch as _sanitize_batch
     from pixmask.pixmask_ext import sanitize_bytes as _sanitize_bytes
 except ImportError as _exc:
     _import_error = _exc
@@ -24,6 +31,8 @@ except ImportError as _exc:
             "Install with: pip install --no-build-isolation -ve ."
         ) from _import_error
 
+    _sanitize_array = _sanitize_batch = _sanitize_bytes
+
 
 # ---------------------------------------------------------------------------
 # Presets (DECISIONS.md §1, §3)
@@ -52,6 +61,9 @@ _PRESETS: dict[str, dict[str, object]] = {
 # One-time warning about paranoid preset (DECISIONS.md §1).
 _WARNED_PARANOID = False
 
+# Must match SanitizeOptions::max_file_bytes in src/cpp/include/pixmask/types.h.
+_MAX_FILE_BYTES = 50 << 20
+
 
 # ---------------------------------------------------------------------------
 # Result type
@@ -80,6 +92,8 @@ def _ndarray_to_png_bytes(arr: np.ndarray) -> bytes:
     import struct
     import zlib
 
+    import numpy as np
+
     if arr.ndim == 2:
         arr = arr[:, :, np.newaxis]
     if arr.dtype != np.uint8:
@@ -93,11 +107,11 @@ def _ndarray_to_png_bytes(arr: np.ndarray) -> bytes:
     color_type = {1: 0, 3: 2, 4: 6}[c]
 
     # Build raw IDAT data: each row prefixed with filter byte 0 (none).
-    raw_rows = []
-    for y in range(h):
-        raw_rows.append(b"\x00")  # filter: none
-        raw_rows.append(arr[y].tobytes())
-    raw_data = b"".join(raw_rows)
+    # One bulk copy into a (h, 1 + w*c) scanline buffer instead of a
+    # per-row tobytes/join loop; zlib reads the buffer without a copy.
+    raw_data = np.empty((h, 1 + w * c), dtype=np.uint8)
+    raw_data[:, 0] = 0  # filter: none
+    raw_data[:, 1:] = arr.reshape(h, w * c)
     compressed = zlib.compress(raw_data)
 
     def _chunk(tag: bytes, data: bytes) -> bytes:
@@ -119,30 +133,69 @@ def _ndarray_to_png_bytes(arr: np.ndarray) -> bytes:
     return out.getvalue()
 
 
-def _coerce_to_bytes(image: Union[np.ndarray, bytes, "Path"]) -> bytes:
-    """Convert various input types to raw image bytes for the C++ pipeline."""
+def _as_hwc_uint8(arr: np.ndarray) -> np.ndarray:
+    """Return *arr* as a C-contiguous uint8 HWC array with 1, 3 or 4 channels."""
+    import numpy as np
+
+    if arr.ndim == 2:
+        arr = arr[:, :, np.newaxis]
+    if arr.dtype != np.uint8:
+        raise TypeError(f"Expected uint8 array, got {arr.dtype}")
+    if arr.ndim != 3:
+        raise ValueError(f"Expected HxW or HxWxC array, got shape {arr.shape}")
+    if arr.shape[2] not in (1, 3, 4):
+        raise ValueError(f"Expected 1, 3, or 4 channels, got {arr.shape[2]}")
+    # No-op for contiguous input; strided views are packed once here.
+    return np.ascontiguousarray(arr)
+
+
+def _coerce_input(
+    image: Union[np.ndarray, bytes, "Path"],
+) -> Union[bytes, np.ndarray]:
+    """Convert an input to what the C++ pipeline consumes.
+
+    numpy arrays and 8-bit PIL images become C-contiguous HWC uint8 pixel
+    buffers, which the extension reads in place (no PNG encode/decode
+    roundtrip). Everything else becomes encoded image bytes.
+    """
     if isinstance(image, bytes):
         return image
 
     if isinstance(image, (str, Path)):
         path = Path(image)
-        if not path.is_file():
+        # A single stat() answers both "is it a file" and "is it too big",
+        # so oversized files are rejected before being read into memory.
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise FileNotFoundError(f"Image file not found: {path}")
+        if st.st_size > _MAX_FILE_BYTES:
+            raise RuntimeError(
+                "file exceeds maximum allowed size "
+                f"({_MAX_FILE_BYTES >> 20} MB)"
+            )
         return path.read_bytes()
 
-    if isinstance(image, np.ndarray):
-        return _ndarray_to_png_bytes(image)
-
-    # Try PIL.Image if available.
-    try:
-        import PIL.Image  # type: ignore[import-untyped]
+    import numpy as np
 
-        if isinstance(image, PIL.Image.Image):
-            buf = io.BytesIO()
-            image.save(buf, format="PNG")
-            return buf.getvalue()
-    except ImportError:
-        pass
+    if isinstance(image, np.ndarray):
+        return _as_hwc_uint8(image)
+
+    # An object can only be a PIL image if Pillow is already loaded, so
+    # don't pay for importing it just to reject an unsupported type.
+    pil_image = sys.modules.get("PIL.Image")
+    if pil_image is not None and isinstance(image, pil_image.Image):
+        # 8-bit modes map straight onto a pixel buffer, skipping a PNG
+        # encode for the extension to decode again.
+        if image.mode in ("L", "RGB", "RGBA"):
+            return _as_hwc_uint8(np.asarray(image))
+        # Anything else (palette, 16-bit, ...) goes through PNG so decode
+        # applies the same conversion it always has.
+        buf = io.BytesIO()
+        image.save(buf, format="PNG")
+        return buf.getvalue()
 
     raise TypeError(
         f"Unsupported image type: {type(image).__name__}. "
@@ -150,6 +203,58 @@ def _coerce_to_bytes(image: Union[np.ndarray, bytes, "Path"]) -> bytes:
     )
 
 
+# ---------------------------------------------------------------------------
+# Option resolution
+# ---------------------------------------------------------------------------
+
+def _resolve_options(
+    preset: str,
+    bit_depth: int | None,
+    jpeg_quality: tuple[int, int] | None,
+    median_radius: int | None,
+) -> tuple[int, int, int, int]:
+    """Resolve preset defaults plus overrides into validated pipeline options.
+
+    Returns ``(bit_depth, median_radius, jpeg_quality_lo, jpeg_quality_hi)``.
+    """
+    global _WARNED_PARANOID  # noqa: PLW0603
+
+    # Validate preset.
+    if preset not in _PRESETS:
+        raise ValueError(
+            f"Unknown preset {preset!r}. Choose from: {', '.join(_PRESETS)}"
+        )
+
+    # One-time advisory about paranoid mode.
+    if not _WARNED_PARANOID:
+        _WARNED_PARANOID = True
+        warnings.warn(
+            "pixmask defaults to preset='balanced'. For maximum protection "
+            "against adversarial images, use preset='paranoid'.",
+            UserWarning,
+            stacklevel=3,
+        )
+
+    # Resolve options: preset defaults, then overrides.
+    p = _PRESETS[preset]
+    bd = bit_depth if bit_depth is not None else int(p["bit_depth"])  # type: ignore[arg-type]
+    mr = median_radius if median_radius is not None else int(p["median_radius"])  # type: ignore[arg-type]
+    jq_lo = jpeg_quality[0] if jpeg_quality is not None else int(p["jpeg_quality_lo"])  # type: ignore[arg-type]
+    jq_hi = jpeg_quality[1] if jpeg_quality is not None else int(p["jpeg_quality_hi"])  # type: ignore[arg-type]
+
+    # Validate ranges.
+    if not 1 <= bd <= 8:
+        raise ValueError(f"bit_depth must be 1-8, got {bd}")
+    if not 0 <= mr <= 3:
+        raise ValueError(f"median_radius must be 0-3, got {mr}")
+    if not 1 <= jq_lo <= jq_hi <= 100:
+        raise ValueError(
+            f"jpeg_quality must satisfy 1 <= lo <= hi <= 100, got ({jq_lo}, {jq_hi})"
+        )
+
+    return bd, mr, jq_lo, jq_hi
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -190,47 +295,17 @@ def sanitize(
         TypeError: Unsupported input type or dtype.
         RuntimeError: C++ pipeline failure (decode error, etc.).
     """
-    global _WARNED_PARANOID  # noqa: PLW0603
-
-    # Validate preset.
-    if preset not in _PRESETS:
-        raise ValueError(
-            f"Unknown preset {preset!r}. Choose from: {', '.join(_PRESETS)}"
-        )
-
-    # One-time advisory about paranoid mode.
-    if not _WARNED_PARANOID:
-        _WARNED_PARANOID = True
-        warnings.warn(
-            "pixmask defaults to preset='balanced'. For maximum protection "
-            "against adversarial images, use preset='paranoid'.",
-            UserWarning,
-            stacklevel=2,
-        )
-
-    # Resolve options: preset defaults, then overrides.
-    p = _PRESETS[preset]
-    bd = bit_depth if bit_depth is not None else int(p["bit_depth"])  # type: ignore[arg-type]
-    mr = median_radius if median_radius is not None else int(p["median_radius"])  # type: ignore[arg-type]
-    jq_lo = jpeg_quality[0] if jpeg_quality is not None else int(p["jpeg_quality_lo"])  # type: ignore[arg-type]
-    jq_hi = jpeg_quality[1] if jpeg_quality is not None else int(p["jpeg_quality_hi"])  # type: ignore[arg-type]
-
-    # Validate ranges.
-    if not 1 <= bd <= 8:
-        raise ValueError(f"bit_depth must be 1-8, got {bd}")
-    if not 0 <= mr <= 3:
-        raise ValueError(f"median_radius must be 0-3, got {mr}")
-    if not 1 <= jq_lo <= jq_hi <= 100:
-        raise ValueError(
-            f"jpeg_quality must satisfy 1 <= lo <= hi <= 100, got ({jq_lo}, {jq_hi})"
-        )
+    bd, mr, jq_lo, jq_hi = _resolve_options(
+        preset, bit_depth, jpeg_quality, median_radius
+    )
 
-    # Coerce input to bytes.
-    raw = _coerce_to_bytes(image)
+    # Coerce input to encoded bytes or a contiguous pixel buffer.
+    src = _coerce_input(image)
 
     # Call C++ pipeline.
-    result_array: np.ndarray = _sanitize_bytes(
-        raw,
+    native = _sanitize_bytes if isinstance(src, bytes) else _sanitize_array
+    result_array: np.ndarray = native(
+        src,
         bit_depth=bd,
         median_radius=mr,
         jpeg_quality_lo=jq_lo,
@@ -277,3 +352,49 @@ def sanitize(
             image=result_array, preset=preset, warnings=warn_list
         )
     return result_array
+
+
+def sanitize_batch(
+    images: Sequence[Union[np.ndarray, bytes, "Path"]],
+    *,
+    preset: str = "balanced",
+    bit_depth: int | None = None,
+    jpeg_quality: tuple[int, int] | None = None,
+    median_radius: int | None = None,
+) -> list[np.ndarray]:
+    """Sanitize several images with one call into the C++ pipeline.
+
+    Equivalent to ``[sanitize(img, ...) for img in images]``, but every image
+    goes through a single native call: the GIL is released once for the
+    whole batch and one pipeline arena is reused across images instead of
+    being allocated per image.
+
+    Args:
+        images: Sequence of inputs, each accepted by :func:`sanitize`.
+        preset: ``"fast"``, ``"balanced"`` (default), or ``"paranoid"``.
+        bit_depth: Override bit depth (1-8). Default depends on preset.
+        jpeg_quality: Override JPEG quality range as ``(lo, hi)`` tuple.
+        median_radius: Override median filter radius (0=disabled, 1=3x3).
+
+    Returns:
+        List of numpy ndarrays (HWC uint8), in input order.
+
+    Raises:
+        ValueError: Invalid preset, bit_depth, or image dimensions.
+        TypeError: Unsupported input type or dtype.
+        RuntimeError: C++ pipeline failure; the message names the index of
+            the first image that failed.
+    """
+    bd, mr, jq_lo, jq_hi = _resolve_options(
+        preset, bit_depth, jpeg_quality, median_radius
+    )
+
+    srcs = [_coerce_input(image) for image in images]
+
+    return _sanitize_batch(
+        srcs,
+        bit_depth=bd,
+        median_radius=mr,
+        jpeg_quality_lo=jq_lo,
+        jpeg_quality_hi=jq_hi,
+    )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, Union, overload
+from typing import Literal, Sequence, Union, overload
 
 import numpy as np
 from numpy.typing import NDArray
@@ -83,3 +83,25 @@ def sanitize(
         numpy ndarray (HWC uint8), bytes, or SanitizeResult.
     """
     ...
+
+def sanitize_batch(
+    images: Sequence[Union[NDArray[np.uint8], bytes, str, Path]],
+    *,
+    preset: str = "balanced",
+    bit_depth: int | None = None,
+    jpeg_quality: tuple[int, int] | None = None,
+    median_radius: int | None = None,
+) -> list[NDArray[np.uint8]]:
+    """Sanitize several images with one call into the C++ pipeline.
+
+    Args:
+        images: Sequence of inputs, each accepted by sanitize().
+        preset: "fast", "balanced" (default), or "paranoid".
+        bit_depth: Override bit depth (1-8).
+        jpeg_quality: Override JPEG quality range as (lo, hi).
+        median_radius: Override median filter radius (0=off, 1=3x3).
+
+    Returns:
+        List of numpy ndarrays (HWC uint8), in input order.
+    """
+    ...
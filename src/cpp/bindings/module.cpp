@@ -4,27 +4,90 @@
 #include <nanobind/nanobind.h>
 #include <nanobind/ndarray.h>
 #include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
 
 #include <cstddef>
 #include <cstdint>
+#include <memory>
 #include <stdexcept>
+#include <string>
+#include <vector>
 
 #include "pixmask/pipeline.h"
 #include "pixmask/types.h"
+#include "pixmask/validate.h"
 
 namespace nb = nanobind;
 using namespace nb::literals;
 
 // C-contiguous uint8 HWC array on CPU — zero-copy input from numpy.
-using InputArray = nb::ndarray<uint8_t,
+// const: the pipeline copies pixels into its arena and never writes them,
+// so read-only arrays are accepted too.
+using InputArray = nb::ndarray<const uint8_t,
                                nb::shape<-1, -1, -1>,
                                nb::device::cpu,
                                nb::c_contig>;
 
+using OutputArray = nb::ndarray<nb::numpy, uint8_t, nb::ndim<3>>;
+
+// ---------------------------------------------------------------------------
+// Helpers: copy a pipeline result out of the arena, then hand it to numpy.
+// ---------------------------------------------------------------------------
+
+// Heap-owned, tightly packed copy of a sanitized image. Safe to build
+// without the GIL; the arena it was copied from may be reset afterwards.
+struct OwnedImage {
+    std::unique_ptr<uint8_t[]> data;
+    size_t height   = 0;
+    size_t width    = 0;
+    size_t channels = 0;
+};
+
+static OwnedImage copy_out(const pixmask::ImageView& img) {
+    OwnedImage out;
+    out.height   = img.height;
+    out.width    = img.width;
+    out.channels = img.channels;
+
+    const size_t row = out.width * out.channels;
+    out.data.reset(new uint8_t[out.height * row]);
+    if (img.stride == row) {
+        // Tightly packed (the JPEG stage always produces this): one copy.
+        std::memcpy(out.data.get(), img.data, out.height * row);
+    } else {
+        for (size_t y = 0; y < out.height; ++y) {
+            std::memcpy(out.data.get() + y * row,
+                        img.data + y * img.stride, row);
+        }
+    }
+    return out;
+}
+
+// Transfer ownership of `img` to a numpy array. Requires the GIL.
+static OutputArray to_numpy(OwnedImage img) {
+    uint8_t* buf = img.data.release();
+    nb::capsule owner(buf, [](void* p) noexcept {
+        delete[] static_cast<uint8_t*>(p);
+    });
+    return OutputArray(buf, {img.height, img.width, img.channels}, owner);
+}
+
+static pixmask::SanitizeOptions make_options(uint8_t bit_depth,
+                                             uint8_t median_radius,
+                                             uint8_t jpeg_quality_lo,
+                                             uint8_t jpeg_quality_hi) {
+    pixmask::SanitizeOptions opts;
+    opts.bit_depth       = bit_depth;
+    opts.median_radius   = median_radius;
+    opts.jpeg_quality_lo = jpeg_quality_lo;
+    opts.jpeg_quality_hi = jpeg_quality_hi;
+    return opts;
+}
+
 // ---------------------------------------------------------------------------
 // sanitize_bytes: accepts raw image bytes (JPEG/PNG), returns HWC uint8 array
 // ---------------------------------------------------------------------------
-static nb::ndarray<nb::numpy, uint8_t, nb::ndim<3>>
+static OutputArray
 sanitize_bytes(nb::bytes input,
                uint8_t bit_depth,
                uint8_t median_radius,
@@ -33,19 +96,20 @@ sanitize_bytes(nb::bytes input,
     const auto* data = reinterpret_cast<const uint8_t*>(input.c_str());
     const size_t len = input.size();
 
-    pixmask::SanitizeOptions opts;
-    opts.bit_depth       = bit_depth;
-    opts.median_radius   = median_radius;
-    opts.jpeg_quality_lo = jpeg_quality_lo;
-    opts.jpeg_quality_hi = jpeg_quality_hi;
+    const pixmask::SanitizeOptions opts = make_options(
+        bit_depth, median_radius, jpeg_quality_lo, jpeg_quality_hi);
 
-    // Pipeline must outlive the memcpy below — result.image.data points
+    // Pipeline must outlive copy_out below — result.image.data points
     // into the Pipeline's arena, which is freed when Pipeline is destroyed.
     pixmask::Pipeline pipeline(opts);
     pixmask::SanitizeResult result;
+    OwnedImage out;
     {
         nb::gil_scoped_release release;
         result = pipeline.sanitize(data, len);
+        if (result.success) {
+            out = copy_out(result.image);
+        }
     }
 
     if (!result.success) {
@@ -53,78 +117,147 @@ sanitize_bytes(nb::bytes input,
             result.error_message ? result.error_message : "sanitize failed");
     }
 
-    const auto& img = result.image;
-    const size_t H = img.height;
-    const size_t W = img.width;
-    const size_t C = img.channels;
-    const size_t n = H * W * C;
-
-    // Copy out of arena into heap-owned buffer before pipeline/arena is destroyed.
-    auto* out_buf = new uint8_t[n];
-    for (size_t y = 0; y < H; ++y) {
-        const uint8_t* src_row = img.data + y * img.stride;
-        uint8_t* dst_row = out_buf + y * W * C;
-        std::memcpy(dst_row, src_row, W * C);
+    return to_numpy(std::move(out));
+}
+
+// ---------------------------------------------------------------------------
+// sanitize_array: accepts HWC uint8 numpy array, returns HWC uint8 array
+// ---------------------------------------------------------------------------
+static void check_shape(const InputArray& img) {
+    const size_t C = img.shape(2);
+    if (C != 1 && C != 3 && C != 4) {
+        throw nb::value_error("channels must be 1, 3, or 4");
+    }
+    // run_pixels narrows to uint32_t; reject anything that would wrap
+    // before the pipeline's max_width/max_height check can see it.
+    if (img.shape(1) > UINT32_MAX) {
+        throw std::runtime_error(pixmask::validation_error_message(
+            pixmask::ValidationError::WidthTooLarge));
+    }
+    if (img.shape(0) > UINT32_MAX) {
+        throw std::runtime_error(pixmask::validation_error_message(
+            pixmask::ValidationError::HeightTooLarge));
     }
+}
 
-    nb::capsule owner(out_buf, [](void* p) noexcept {
-        delete[] static_cast<uint8_t*>(p);
-    });
+static pixmask::SanitizeResult run_pixels(pixmask::Pipeline& pipeline,
+                                          const InputArray& img) {
+    // Dimensions were range-checked by check_shape().
+    const auto W = static_cast<uint32_t>(img.shape(1));
+    const auto C = static_cast<uint32_t>(img.shape(2));
+    return pipeline.sanitize_pixels(img.data(),
+                                    W, static_cast<uint32_t>(img.shape(0)),
+                                    C, static_cast<size_t>(W) * C);
+}
 
-    return nb::ndarray<nb::numpy, uint8_t, nb::ndim<3>>(
-        out_buf, {H, W, C}, owner);
+static OutputArray
+sanitize_array(InputArray img,
+               uint8_t bit_depth,
+               uint8_t median_radius,
+               uint8_t jpeg_quality_lo,
+               uint8_t jpeg_quality_hi) {
+    check_shape(img);
+
+    const pixmask::SanitizeOptions opts = make_options(
+        bit_depth, median_radius, jpeg_quality_lo, jpeg_quality_hi);
+
+    // Pixels go straight to the pipeline — no PNG encode/decode roundtrip.
+    // The numpy buffer is read in place and copied into the arena.
+    pixmask::Pipeline pipeline(opts);
+    pixmask::SanitizeResult result;
+    OwnedImage out;
+    {
+        nb::gil_scoped_release release;
+        result = run_pixels(pipeline, img);
+        if (result.success) {
+            out = copy_out(result.image);
+        }
+    }
+
+    if (!result.success) {
+        throw std::runtime_error(
+            result.error_message ? result.error_message : "sanitize failed");
+    }
+
+    return to_numpy(std::move(out));
 }
 
 // ---------------------------------------------------------------------------
-// sanitize_array: accepts HWC uint8 numpy array, returns HWC uint8 array
+// sanitize_batch: many images (encoded bytes or arrays), one GIL release,
+// one arena
 // ---------------------------------------------------------------------------
-static nb::ndarray<nb::numpy, uint8_t, nb::ndim<3>>
-sanitize_array(InputArray img,
+static nb::list
+sanitize_batch(const std::vector<nb::object>& inputs,
                uint8_t bit_depth,
                uint8_t median_radius,
                uint8_t jpeg_quality_lo,
                uint8_t jpeg_quality_hi) {
-    const size_t H = img.shape(0);
-    const size_t W = img.shape(1);
-    const size_t C = img.shape(2);
+    const size_t n = inputs.size();
+    nb::list arrays;
+    if (n == 0) {
+        return arrays;
+    }
 
-    if (C != 1 && C != 3 && C != 4) {
-        throw nb::value_error("channels must be 1, 3, or 4");
+    // Resolve every input while holding the GIL. `inputs` keeps the bytes
+    // objects alive, and `pixels` holds a reference to each array.
+    std::vector<const uint8_t*> data(n, nullptr);
+    std::vector<size_t> lens(n, 0);
+    std::vector<InputArray> pixels(n);
+    for (size_t i = 0; i < n; ++i) {
+        if (nb::isinstance<nb::bytes>(inputs[i])) {
+            nb::bytes b = nb::borrow<nb::bytes>(inputs[i]);
+            data[i] = reinterpret_cast<const uint8_t*>(b.c_str());
+            lens[i] = b.size();
+        } else {
+            if (!nb::try_cast<InputArray>(inputs[i], pixels[i])) {
+                const std::string msg =
+                    "image " + std::to_string(i) +
+                    ": expected bytes or a C-contiguous uint8 HxWxC array, got " +
+                    nb::type_name(inputs[i].type()).c_str();
+                throw nb::type_error(msg.c_str());
+            }
+            check_shape(pixels[i]);
+        }
     }
 
-    pixmask::SanitizeOptions opts;
-    opts.bit_depth       = bit_depth;
-    opts.median_radius   = median_radius;
-    opts.jpeg_quality_lo = jpeg_quality_lo;
-    opts.jpeg_quality_hi = jpeg_quality_hi;
+    const pixmask::SanitizeOptions opts = make_options(
+        bit_depth, median_radius, jpeg_quality_lo, jpeg_quality_hi);
+
+    std::vector<OwnedImage> outputs(n);
+    size_t failed_index = n;
+    const char* failed_message = nullptr;
+    {
+        nb::gil_scoped_release release;
+        // One Pipeline for the whole batch: its default arena block is
+        // reused between images instead of being allocated and freed once
+        // per image. Overflow blocks a large image needed are trimmed once
+        // its output is copied out, so the batch never holds more than the
+        // default block plus the image in flight.
+        pixmask::Pipeline pipeline(opts);
+        for (size_t i = 0; i < n; ++i) {
+            const pixmask::SanitizeResult result =
+                data[i] ? pipeline.sanitize(data[i], lens[i])
+                        : run_pixels(pipeline, pixels[i]);
+            if (!result.success) {
+                failed_index = i;
+                failed_message = result.error_message;
+                break;
+            }
+            outputs[i] = copy_out(result.image);
+            pipeline.trim_arena();
+        }
+    }
+
+    if (failed_index < n) {
+        throw std::runtime_error(
+            "image " + std::to_string(failed_index) + ": " +
+            (failed_message ? failed_message : "sanitize failed"));
+    }
 
-    // Build ImageView over the numpy buffer — zero-copy.
-    pixmask::ImageView view;
-    view.data     = img.data();
-    view.width    = static_cast<uint32_t>(W);
-    view.height   = static_cast<uint32_t>(H);
-    view.channels = static_cast<uint32_t>(C);
-    view.stride   = static_cast<uint32_t>(W * C);
-
-    // We need to pass raw bytes to the C++ pipeline.  The pipeline expects
-    // encoded bytes (JPEG/PNG), so for array input we encode to PNG first,
-    // then let the pipeline decode+sanitize.  However, the architecture also
-    // supports an in-memory pixel path via Pipeline::sanitize on raw bytes.
-    //
-    // For v0.1 the canonical path is bytes-in → bytes-out through the
-    // full pipeline.  Array input is handled at the Python layer by encoding
-    // to PNG bytes first (see python/pixmask/__init__.py).  This C++ binding
-    // directly sanitizes raw encoded bytes.
-    //
-    // TODO(v0.2): Add a pixel-buffer entry point that skips decode/validate.
-
-    // For now, this binding is not exposed to Python — the Python layer
-    // handles array→bytes conversion.  Keep the implementation for future use.
-    (void)view;
-
-    throw std::runtime_error(
-        "Direct array sanitization not yet implemented in C++ pipeline. "
-        "Use sanitize_bytes with encoded image data.");
+    for (auto& img : outputs) {
+        arrays.append(to_numpy(std::move(img)));
+    }
+    return arrays;
 }
 
 // ---------------------------------------------------------------------------
@@ -153,7 +286,21 @@ NB_MODULE(pixmask_ext, m) {
         "median_radius"_a   = 1,
         "jpeg_quality_lo"_a = 70,
         "jpeg_quality_hi"_a = 85,
-        "Sanitize a uint8 HxWxC numpy array. Returns new array.\n"
+        "Sanitize a C-contiguous uint8 HxWxC numpy array (C in 1, 3, 4).\n"
+        "Skips decode. Returns new uint8 HxWx3 array; input is not modified.\n"
         "GIL is released during C++ processing."
     );
+
+    m.def(
+        "sanitize_batch",
+        &sanitize_batch,
+        "images"_a,
+        "bit_depth"_a       = 5,
+        "median_radius"_a   = 1,
+        "jpeg_quality_lo"_a = 70,
+        "jpeg_quality_hi"_a = 85,
+        "Sanitize a list of raw JPEG/PNG bytes and/or uint8 HxWxC arrays\n"
+        "with one shared pipeline. Returns a list of uint8 HxWxC numpy\n"
+        "arrays in input order. GIL is released once for the whole batch."
+    );
 }
@@ -50,6 +50,11 @@ public:
     // All previously returned pointers are invalidated after reset().
     void reset() noexcept;
 
+    // reset(), then free every block after the initial one, so capacity
+    // returns to the constructor's block size. Use between independent
+    // workloads so one oversized request doesn't pin memory (or its data).
+    void trim() noexcept;
+
     // Total bytes allocated across all blocks (capacity, not bytes in use).
     [[nodiscard]] size_t capacity_bytes() const noexcept;
 
@@ -23,13 +23,32 @@ public:
     // Main entry point: sanitize raw image bytes.
     // Thread safety: NOT thread-safe. One Pipeline per thread.
     // All previously returned SanitizeResult.image pointers are
-    // invalidated when sanitize() is called again (arena reset).
+    // invalidated when sanitize() is called again (arena reset; blocks the
+    // arena has grown are kept for reuse — see trim_arena()).
     SanitizeResult sanitize(const uint8_t* data, size_t len);
 
+    // Sanitize an already-decoded pixel buffer (1, 3 or 4 channels, rows
+    // `stride` bytes apart). Skips validate/decode: the pixels are copied
+    // into the arena as RGB — the layout decode produces — and then run
+    // through the same stages, so output matches the encoded-bytes path.
+    // `pixels` is never written. Dimension limits from SanitizeOptions
+    // still apply. Same thread-safety and lifetime rules as sanitize().
+    SanitizeResult sanitize_pixels(const uint8_t* pixels,
+                                   uint32_t width, uint32_t height,
+                                   uint32_t channels, size_t stride);
+
+    // Free arena blocks beyond the initial one (Arena::trim), returning the
+    // Pipeline to its default footprint after a large image. Invalidates
+    // the last SanitizeResult.image, as the next sanitize() call would.
+    void trim_arena() noexcept { arena_.trim(); }
+
     // Expose arena for diagnostics / testing.
     [[nodiscard]] const Arena& arena() const noexcept { return arena_; }
 
 private:
+    // Stages 3-5, shared by both entry points. `image` lives in arena_.
+    SanitizeResult run_stages(ImageView image);
+
     SanitizeOptions opts_;
     Arena arena_;
 };
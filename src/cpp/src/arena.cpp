@@ -81,6 +81,14 @@ void Arena::reset() noexcept {
     current_ = head_;
 }
 
+void Arena::trim() noexcept {
+    if (head_ != nullptr) {
+        free_chain(head_->next);
+        head_->next = nullptr;
+    }
+    reset();
+}
+
 // ---------------------------------------------------------------------------
 // Diagnostics
 // ---------------------------------------------------------------------------
@@ -184,11 +184,27 @@ ImageView jpeg_roundtrip(const ImageView& input, Arena& arena,
     }
     wb.capacity = prealloc;
 
-    // stb_image_write expects tightly-packed rows. If stride != width*channels,
-    // we need to pass stride-aware data. stbi_write_jpg_to_func does not
-    // support stride, so we must use tightly-packed input or copy rows.
-    // For now, assert tight packing; pipeline stages produce tight images.
+    // stb_image_write expects tightly-packed rows and has no stride
+    // parameter. Decode, ingest and median write 64-byte-aligned strides and
+    // leave the row padding uninitialized, so pack those rows first —
+    // otherwise the encoder shears the image and reads stale padding bytes
+    // (data from a previous image when the arena is reused).
     const uint8_t* encode_data = input.data;
+    const size_t row_bytes = static_cast<size_t>(input.width) * input.channels;
+    if (input.stride != row_bytes) {
+        uint8_t* packed = nullptr;
+        try {
+            packed = static_cast<uint8_t*>(arena.allocate(raw_size));
+        } catch (...) {
+            std::free(wb.data);
+            return fail("jpeg_roundtrip: arena allocation failed");
+        }
+        for (uint32_t y = 0; y < input.height; ++y) {
+            std::memcpy(packed + y * row_bytes,
+                        input.data + y * input.stride, row_bytes);
+        }
+        encode_data = packed;
+    }
 
     const int encode_ok = stbi_write_jpg_to_func(
         jpeg_write_cb, &wb,
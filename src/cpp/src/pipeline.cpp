@@ -7,6 +7,9 @@
 #include "pixmask/median.h"
 #include "pixmask/jpeg_roundtrip.h"
 
+#include <cstring>
+#include <new>  // std::bad_alloc
+
 namespace pixmask {
 
 // ---------------------------------------------------------------------------
@@ -102,6 +105,101 @@ SanitizeResult Pipeline::sanitize(const uint8_t* data, size_t len) {
                           "image decoding failed");
     }
 
+    return run_stages(image);
+}
+
+// ---------------------------------------------------------------------------
+// Helper: copy caller pixels into the arena as RGB with aligned stride —
+// the same layout decode_image() produces. Gray is replicated and alpha is
+// dropped, matching stb_image's conversion on the encoded-bytes path.
+// ---------------------------------------------------------------------------
+
+static ImageView ingest_pixels(const uint8_t* src,
+                               uint32_t width, uint32_t height,
+                               uint32_t channels, size_t src_stride,
+                               Arena& arena) {
+    constexpr uint32_t kChannelsRGB = 3;
+    const uint32_t stride = aligned_stride(width, kChannelsRGB);
+    auto* out = static_cast<uint8_t*>(
+        arena.allocate(static_cast<size_t>(stride) * height));
+
+    for (uint32_t y = 0; y < height; ++y) {
+        const uint8_t* s = src + static_cast<size_t>(y) * src_stride;
+        uint8_t* d = out + static_cast<size_t>(y) * stride;
+        if (channels == kChannelsRGB) {
+            std::memcpy(d, s, static_cast<size_t>(width) * kChannelsRGB);
+        } else if (channels == 1) {
+            for (uint32_t x = 0; x < width; ++x, d += 3) {
+                d[0] = d[1] = d[2] = s[x];
+            }
+        } else {  // RGBA
+            for (uint32_t x = 0; x < width; ++x, s += 4, d += 3) {
+                d[0] = s[0];
+                d[1] = s[1];
+                d[2] = s[2];
+            }
+        }
+    }
+
+    ImageView view{};
+    view.data     = out;
+    view.width    = width;
+    view.height   = height;
+    view.channels = kChannelsRGB;
+    view.stride   = stride;
+    return view;
+}
+
+// ---------------------------------------------------------------------------
+// Pipeline::sanitize_pixels — entry point for already-decoded buffers.
+// ---------------------------------------------------------------------------
+
+SanitizeResult Pipeline::sanitize_pixels(const uint8_t* pixels,
+                                         uint32_t width, uint32_t height,
+                                         uint32_t channels, size_t stride) {
+    // Stage 0: Reset arena — all previous pointers invalidated.
+    arena_.reset();
+
+    // Stage 0: Validate the buffer shape against the same limits as
+    // encoded input (there is no header or file size to check).
+    ValidationError ve = ValidationError::Ok;
+    if (pixels == nullptr) {
+        ve = ValidationError::NullInput;
+    } else if (width == 0 || height == 0) {
+        ve = ValidationError::ZeroDimension;
+    } else if (width > opts_.max_width) {
+        ve = ValidationError::WidthTooLarge;
+    } else if (height > opts_.max_height) {
+        ve = ValidationError::HeightTooLarge;
+    }
+    if (ve != ValidationError::Ok) {
+        return make_error(map_validation_error(ve),
+                          validation_error_message(ve));
+    }
+    if ((channels != 1 && channels != 3 && channels != 4) ||
+        stride < static_cast<size_t>(width) * channels) {
+        return make_error(SanitizeError::UnsupportedFormat,
+                          "pixel buffer must have 1, 3 or 4 channels "
+                          "and stride >= width * channels");
+    }
+
+    // Stage 1: Copy pixels into the arena (never modify the caller's buffer).
+    ImageView image;
+    try {
+        image = ingest_pixels(pixels, width, height, channels, stride, arena_);
+    } catch (const std::bad_alloc&) {
+        return make_error(SanitizeError::OomFailed,
+                          "pixel buffer allocation failed");
+    }
+
+    return run_stages(image);
+}
+
+// ---------------------------------------------------------------------------
+// Pipeline::run_stages — stages 3-5 on an arena-owned image.
+// ---------------------------------------------------------------------------
+
+SanitizeResult Pipeline::run_stages(ImageView image) {
     // Stage 3: Bit-depth reduction (in-place).
     reduce_bit_depth(image, opts_.bit_depth);
 
@@ -258,3 +258,27 @@ TEST_CASE("jpeg_roundtrip with fixed quality (lo == hi)") {
 
     CHECK(std::memcmp(result1.data(), out2.data, pixel_count) == 0);
 }
+
+TEST_CASE("jpeg_roundtrip honours input stride") {
+    // 40x24 RGB: 120-byte rows padded to 128, padding filled with junk that
+    // must not reach the encoder.
+    const uint32_t w = 40, h = 24, ch = 3;
+    const size_t row = w * ch, stride = 128;
+    auto tight = make_gradient(w, h, ch);
+    std::vector<uint8_t> padded(stride * h, 0xFF);
+    for (uint32_t y = 0; y < h; ++y) {
+        std::memcpy(padded.data() + y * stride, tight.data() + y * row, row);
+    }
+
+    pixmask::ImageView src = make_view(padded, w, h, ch);
+    src.stride = stride;
+
+    pixmask::Arena arena_a, arena_b;
+    auto from_tight  = pixmask::jpeg_roundtrip(make_view(tight, w, h, ch),
+                                               arena_a, 90, 90);
+    auto from_padded = pixmask::jpeg_roundtrip(src, arena_b, 90, 90);
+    REQUIRE(from_tight.data != nullptr);
+    REQUIRE(from_padded.data != nullptr);
+    CHECK(from_padded.stride == row);
+    CHECK(std::memcmp(from_tight.data, from_padded.data, row * h) == 0);
+}
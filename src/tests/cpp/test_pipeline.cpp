@@ -163,3 +163,165 @@ TEST_CASE("Pipeline: file too large is rejected") {
     CHECK_FALSE(result.success);
     CHECK(result.error_code == pixmask::SanitizeError::FileTooLarge);
 }
+
+TEST_CASE("Pipeline: trim_arena returns to default capacity after a large image") {
+    // 2048x2048 RGB: each stage's output is 12 MB, more than one block holds.
+    const uint32_t big = 2048;
+    std::vector<uint8_t> large(static_cast<size_t>(big) * big * 3, 90);
+    std::vector<uint8_t> small(16 * 16 * 3, 90);
+
+    pixmask::Pipeline pipeline;
+    REQUIRE(pipeline.sanitize_pixels(large.data(), big, big, 3, big * 3).success);
+    const size_t grown = pipeline.arena().capacity_bytes();
+    CHECK(grown > pixmask::Arena::kDefaultBlockSize);
+
+    // A plain reset (the next call) keeps grown blocks for reuse...
+    REQUIRE(pipeline.sanitize_pixels(small.data(), 16, 16, 3, 16 * 3).success);
+    CHECK(pipeline.arena().capacity_bytes() == grown);
+
+    // ...trim_arena() frees them.
+    pipeline.trim_arena();
+    CHECK(pipeline.arena().capacity_bytes() == pixmask::Arena::kDefaultBlockSize);
+    REQUIRE(pipeline.sanitize_pixels(small.data(), 16, 16, 3, 16 * 3).success);
+    CHECK(pipeline.arena().capacity_bytes() == pixmask::Arena::kDefaultBlockSize);
+}
+
+// ===========================================================================
+// sanitize_pixels — decoded pixel-buffer entry point
+// ===========================================================================
+
+TEST_CASE("Pipeline: sanitize_pixels on RGB buffer succeeds") {
+    std::vector<uint8_t> rgb(64 * 48 * 3, 0);
+    for (size_t i = 0; i < rgb.size(); i += 3) rgb[i] = 200;
+
+    pixmask::Pipeline pipeline;
+    auto result = pipeline.sanitize_pixels(rgb.data(), 64, 48, 3, 64 * 3);
+
+    REQUIRE(result.success);
+    CHECK(result.image.width == 64);
+    CHECK(result.image.height == 48);
+    CHECK(result.image.channels == 3);
+}
+
+TEST_CASE("Pipeline: sanitize_pixels converts gray and RGBA to RGB") {
+    pixmask::Pipeline pipeline;
+
+    std::vector<uint8_t> gray(16 * 16, 128);
+    auto r1 = pipeline.sanitize_pixels(gray.data(), 16, 16, 1, 16);
+    REQUIRE(r1.success);
+    CHECK(r1.image.channels == 3);
+
+    std::vector<uint8_t> rgba(16 * 16 * 4, 255);
+    auto r2 = pipeline.sanitize_pixels(rgba.data(), 16, 16, 4, 16 * 4);
+    REQUIRE(r2.success);
+    CHECK(r2.image.channels == 3);
+}
+
+TEST_CASE("Pipeline: sanitize_pixels matches the encoded-bytes path") {
+    // PNG is lossless, so decoding it yields exactly these pixels.
+    std::vector<uint8_t> rgb(40 * 24 * 3);
+    for (size_t i = 0; i < rgb.size(); ++i) rgb[i] = static_cast<uint8_t>(i * 7);
+
+    std::vector<uint8_t> png;
+    REQUIRE(stbi_write_png_to_func(vec_write, &png, 40, 24, 3,
+                                   rgb.data(), 40 * 3) != 0);
+
+    pixmask::SanitizeOptions opts{};
+    opts.jpeg_quality_lo = opts.jpeg_quality_hi = 80;  // deterministic
+
+    pixmask::Pipeline a(opts);
+    pixmask::Pipeline b(opts);
+    auto from_pixels = a.sanitize_pixels(rgb.data(), 40, 24, 3, 40 * 3);
+    auto from_bytes  = b.sanitize(png.data(), png.size());
+    REQUIRE(from_pixels.success);
+    REQUIRE(from_bytes.success);
+    REQUIRE(from_pixels.image.stride == from_bytes.image.stride);
+    CHECK(std::memcmp(from_pixels.image.data, from_bytes.image.data,
+                      from_pixels.image.total_bytes()) == 0);
+}
+
+TEST_CASE("Pipeline: sanitize_pixels output tracks the input across reuse") {
+    // Smooth 40x24 ramp: 120-byte rows, so every stage pads them to 128.
+    // Linear ramps pass the median unchanged, leaving only JPEG error.
+    const uint32_t w = 40, h = 24;
+    std::vector<uint8_t> ramp(static_cast<size_t>(w) * h * 3);
+    for (uint32_t y = 0; y < h; ++y) {
+        for (uint32_t x = 0; x < w; ++x) {
+            uint8_t* p = ramp.data() + (static_cast<size_t>(y) * w + x) * 3;
+            p[0] = static_cast<uint8_t>(x * 6);
+            p[1] = static_cast<uint8_t>(y * 10);
+            p[2] = 128;
+        }
+    }
+    // Larger noisy image first, so the ramp lands on dirty arena memory.
+    std::vector<uint8_t> noise(96 * 64 * 3);
+    for (size_t i = 0; i < noise.size(); ++i) noise[i] = static_cast<uint8_t>(i * 151 + 7);
+
+    pixmask::SanitizeOptions opts{};
+    opts.bit_depth = 8;
+    opts.jpeg_quality_lo = opts.jpeg_quality_hi = 100;
+    pixmask::Pipeline pipeline(opts);
+
+    REQUIRE(pipeline.sanitize_pixels(noise.data(), 96, 64, 3, 96 * 3).success);
+
+    std::vector<uint8_t> first;
+    for (int run = 0; run < 2; ++run) {
+        auto result = pipeline.sanitize_pixels(ramp.data(), w, h, 3, w * 3);
+        REQUIRE(result.success);
+        const size_t row = static_cast<size_t>(w) * 3;
+        REQUIRE(result.image.stride == row);
+
+        int max_diff = 0;
+        for (size_t i = 0; i < ramp.size(); ++i) {
+            const int d = static_cast<int>(result.image.data[i]) - ramp[i];
+            max_diff = d > max_diff ? d : (-d > max_diff ? -d : max_diff);
+        }
+        CHECK(max_diff <= 8);
+
+        if (run == 0) {
+            first.assign(result.image.data, result.image.data + ramp.size());
+        } else {
+            CHECK(std::memcmp(first.data(), result.image.data, ramp.size()) == 0);
+        }
+    }
+}
+
+TEST_CASE("Pipeline: sanitize_pixels honours stride and leaves input intact") {
+    // 8x4 RGB with 8 bytes of row padding.
+    const uint32_t w = 8, h = 4, stride = w * 3 + 8;
+    std::vector<uint8_t> buf(static_cast<size_t>(stride) * h, 0xEE);
+    const std::vector<uint8_t> before = buf;
+
+    pixmask::Pipeline pipeline;
+    auto result = pipeline.sanitize_pixels(buf.data(), w, h, 3, stride);
+
+    REQUIRE(result.success);
+    CHECK(result.image.width == w);
+    CHECK(result.image.height == h);
+    CHECK(buf == before);
+}
+
+TEST_CASE("Pipeline: sanitize_pixels rejects invalid buffers") {
+    std::vector<uint8_t> rgb(64 * 48 * 3, 0);
+
+    pixmask::SanitizeOptions opts{};
+    opts.max_width = 32;
+    pixmask::Pipeline pipeline(opts);
+
+    auto too_wide = pipeline.sanitize_pixels(rgb.data(), 64, 48, 3, 64 * 3);
+    CHECK_FALSE(too_wide.success);
+    CHECK(too_wide.error_code == pixmask::SanitizeError::DimensionsTooLarge);
+
+    auto null_input = pipeline.sanitize_pixels(nullptr, 16, 16, 3, 16 * 3);
+    CHECK_FALSE(null_input.success);
+
+    auto zero = pipeline.sanitize_pixels(rgb.data(), 0, 16, 3, 0);
+    CHECK_FALSE(zero.success);
+
+    auto bad_channels = pipeline.sanitize_pixels(rgb.data(), 16, 16, 2, 16 * 2);
+    CHECK_FALSE(bad_channels.success);
+    CHECK(bad_channels.error_code == pixmask::SanitizeError::UnsupportedFormat);
+
+    auto short_stride = pipeline.sanitize_pixels(rgb.data(), 16, 16, 3, 16);
+    CHECK_FALSE(short_stride.success);
+}
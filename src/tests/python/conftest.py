@@ -22,11 +22,10 @@ def _encode_png(arr: np.ndarray) -> bytes:
     h, w, c = arr.shape
     color_type = {1: 0, 3: 2, 4: 6}[c]
 
-    raw_rows = []
-    for y in range(h):
-        raw_rows.append(b"\x00")
-        raw_rows.append(arr[y].tobytes())
-    compressed = zlib.compress(b"".join(raw_rows))
+    # Filter byte 0 (none) followed by each row, written in one bulk copy.
+    raw = np.zeros((h, 1 + w * c), dtype=np.uint8)
+    raw[:, 1:] = arr.reshape(h, w * c)
+    compressed = zlib.compress(raw)
 
     def _chunk(tag: bytes, data: bytes) -> bytes:
         chunk_data = tag + data
@@ -43,17 +42,26 @@ def _encode_png(arr: np.ndarray) -> bytes:
 
 # ---------------------------------------------------------------------------
 # Image generators
+#
+# Session-scoped: each image is built once per test run. Arrays are marked
+# read-only so a test that mutates its input fails loudly instead of
+# leaking into later tests.
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+def _frozen(arr: np.ndarray) -> np.ndarray:
+    arr.flags.writeable = False
+    return arr
+
+
+@pytest.fixture(scope="session")
 def solid_red_array() -> np.ndarray:
     """8x8 solid red image (HWC uint8)."""
     img = np.zeros((8, 8, 3), dtype=np.uint8)
     img[:, :, 0] = 255
-    return img
+    return _frozen(img)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gradient_array() -> np.ndarray:
     """16x16 horizontal gradient (HWC uint8 RGB)."""
     grad = np.linspace(0, 255, 16, dtype=np.uint8)
@@ -61,39 +69,42 @@ def gradient_array() -> np.ndarray:
     img[:, :, 0] = grad[np.newaxis, :]
     img[:, :, 1] = grad[:, np.newaxis]
     img[:, :, 2] = 128
-    return img
+    return _frozen(img)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def noise_array() -> np.ndarray:
     """32x32 random noise image (HWC uint8 RGB)."""
     rng = np.random.default_rng(42)
-    return rng.integers(0, 256, size=(32, 32, 3), dtype=np.uint8)
+    return _frozen(rng.integers(0, 256, size=(32, 32, 3), dtype=np.uint8))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gray_array() -> np.ndarray:
     """16x16 single-channel grayscale image."""
-    return np.full((16, 16, 1), 128, dtype=np.uint8)
+    return _frozen(np.full((16, 16, 1), 128, dtype=np.uint8))
 
 
 # ---------------------------------------------------------------------------
 # PNG bytes fixtures
+#
+# Session-scoped like the arrays they encode: bytes are immutable, so one
+# encode per run is safe to share.
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def solid_red_bytes(solid_red_array: np.ndarray) -> bytes:
     """Solid red image as PNG bytes."""
     return _encode_png(solid_red_array)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gradient_bytes(gradient_array: np.ndarray) -> bytes:
     """Gradient image as PNG bytes."""
     return _encode_png(gradient_array)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def noise_bytes(noise_array: np.ndarray) -> bytes:
     """Noise image as PNG bytes."""
     return _encode_png(noise_array)
@@ -101,27 +112,34 @@ def noise_bytes(noise_array: np.ndarray) -> bytes:
 
 # ---------------------------------------------------------------------------
 # File path fixtures
+#
+# Written once per run into a shared temp directory. Tests only read them.
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def solid_red_path(solid_red_bytes: bytes, tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def _png_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("png")
+
+
+@pytest.fixture(scope="session")
+def solid_red_path(solid_red_bytes: bytes, _png_dir: Path) -> Path:
     """Write solid red PNG to a temp file and return path."""
-    p = tmp_path / "solid_red.png"
+    p = _png_dir / "solid_red.png"
     p.write_bytes(solid_red_bytes)
     return p
 
 
-@pytest.fixture
-def gradient_path(gradient_bytes: bytes, tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def gradient_path(gradient_bytes: bytes, _png_dir: Path) -> Path:
     """Write gradient PNG to a temp file and return path."""
-    p = tmp_path / "gradient.png"
+    p = _png_dir / "gradient.png"
     p.write_bytes(gradient_bytes)
     return p
 
 
-@pytest.fixture
-def noise_path(noise_bytes: bytes, tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def noise_path(noise_bytes: bytes, _png_dir: Path) -> Path:
     """Write noise PNG to a temp file and return path."""
-    p = tmp_path / "noise.png"
+    p = _png_dir / "noise.png"
     p.write_bytes(noise_bytes)
     return p
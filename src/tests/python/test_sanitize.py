@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import io
+import os
+import subprocess
+import sys
+import zlib
 from pathlib import Path
 
 import numpy as np
 import pytest
 
 import pixmask
-from pixmask import SanitizeResult, sanitize
+from pixmask import SanitizeResult, sanitize, sanitize_batch
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +45,32 @@ class TestNumpyInput:
         assert isinstance(result, np.ndarray)
         assert result.dtype == np.uint8
 
+    def test_input_not_modified(self, noise_array: np.ndarray) -> None:
+        arr = noise_array.copy()
+        sanitize(arr)
+        np.testing.assert_array_equal(arr, noise_array)
+
+    def test_rgba_array(self) -> None:
+        arr = np.full((8, 8, 4), 200, dtype=np.uint8)
+        result = sanitize(arr)
+        assert result.shape == (8, 8, 3)
+
+    def test_bad_channel_count_raises(self) -> None:
+        with pytest.raises(ValueError, match="channels"):
+            sanitize(np.zeros((8, 8, 2), dtype=np.uint8))
+
+    def test_width_beyond_uint32_raises(self) -> None:
+        # Zero rows, so no memory; the width must not wrap to 16.
+        arr = np.empty((0, (1 << 32) + 16, 3), dtype=np.uint8)
+        with pytest.raises(RuntimeError, match="width exceeds maximum"):
+            sanitize(arr)
+
+    def test_non_contiguous_array(self, noise_array: np.ndarray) -> None:
+        view = noise_array[::2, ::2]
+        assert not view.flags["C_CONTIGUOUS"]
+        result = sanitize(view)
+        assert result.shape[:2] == view.shape[:2]
+
 
 class TestBytesInput:
     """sanitize() accepts raw PNG/JPEG bytes."""
@@ -73,6 +104,41 @@ class TestPathInput:
         with pytest.raises(FileNotFoundError):
             sanitize(tmp_path / "nonexistent.png")
 
+    def test_directory_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            sanitize(tmp_path)
+
+    def test_oversized_file_raises(self, tmp_path: Path) -> None:
+        p = tmp_path / "huge.png"
+        with p.open("wb") as f:
+            f.truncate(pixmask._MAX_FILE_BYTES + 1)  # sparse; never read
+        with pytest.raises(RuntimeError, match="maximum allowed size"):
+            sanitize(p)
+
+
+class TestPILInput:
+    """sanitize() accepts PIL images, matching their PNG-encoded form."""
+
+    @pytest.mark.parametrize("mode", ["L", "RGB", "RGBA", "P", "I;16"])
+    def test_matches_png_bytes(self, mode: str, noise_array: np.ndarray) -> None:
+        Image = pytest.importorskip("PIL.Image")
+        if mode == "I;16":
+            img = Image.fromarray(noise_array[:, :, 0].astype(np.uint16) * 257)
+        elif mode == "L":
+            img = Image.fromarray(noise_array[:, :, 0])
+        elif mode == "RGBA":
+            alpha = np.full(noise_array.shape[:2] + (1,), 128, dtype=np.uint8)
+            img = Image.fromarray(np.concatenate([noise_array, alpha], axis=2))
+        else:
+            img = Image.fromarray(noise_array).convert(mode)
+        assert img.mode == mode
+
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+        expected = sanitize(buf.getvalue(), jpeg_quality=(80, 80))
+        result = sanitize(img, jpeg_quality=(80, 80))
+        np.testing.assert_array_equal(result, expected)
+
 
 # ---------------------------------------------------------------------------
 # Presets
@@ -157,6 +223,18 @@ class TestOutputFormat:
         # PNG signature
         assert result[:4] == b"\x89PNG"
 
+    def test_png_output_pixels(self, noise_bytes: bytes) -> None:
+        expected = sanitize(noise_bytes, jpeg_quality=(80, 80))
+        png = sanitize(noise_bytes, jpeg_quality=(80, 80), output_format="png")
+        # Our encoder writes a single IDAT with filter byte 0 on every row.
+        start = png.index(b"IDAT") + 4
+        length = int.from_bytes(png[start - 8:start - 4], "big")
+        raw = np.frombuffer(zlib.decompress(png[start:start + length]), np.uint8)
+        h, w, c = expected.shape
+        raw = raw.reshape(h, 1 + w * c)
+        assert not raw[:, 0].any()
+        np.testing.assert_array_equal(raw[:, 1:].reshape(h, w, c), expected)
+
     def test_bytes_alias(self, noise_bytes: bytes) -> None:
         result = sanitize(noise_bytes, output_format="bytes")
         assert isinstance(result, bytes)
@@ -166,6 +244,76 @@ class TestOutputFormat:
             sanitize(solid_red_bytes, output_format="bmp")
 
 
+# ---------------------------------------------------------------------------
+# Batch API
+# ---------------------------------------------------------------------------
+
+
+class TestBatch:
+    """sanitize_batch() sanitizes many images in one native call."""
+
+    def test_mixed_inputs(
+        self,
+        solid_red_array: np.ndarray,
+        gradient_bytes: bytes,
+        noise_path: Path,
+    ) -> None:
+        images = [solid_red_array, gradient_bytes, noise_path]
+        results = sanitize_batch(images, jpeg_quality=(80, 80))
+        assert len(results) == 3
+        for image, result in zip(images, results):
+            assert result.dtype == np.uint8
+            expected = sanitize(image, jpeg_quality=(80, 80))
+            np.testing.assert_array_equal(result, expected)
+
+    def test_preserves_order(
+        self, solid_red_array: np.ndarray, noise_array: np.ndarray
+    ) -> None:
+        results = sanitize_batch([solid_red_array, noise_array, solid_red_array])
+        assert [r.shape[:2] for r in results] == [(8, 8), (32, 32), (8, 8)]
+
+    @pytest.mark.parametrize("q", [80, 100])
+    def test_matches_individual_calls(
+        self, q: int, noise_array: np.ndarray, gradient_array: np.ndarray
+    ) -> None:
+        # Small images whose rows (3 * w bytes) are not a multiple of 64
+        # follow larger ones, so reused arena memory sits under their row
+        # padding; none of it may reach the output.
+        images = [
+            np.full((300, 300, 3), (255, 0, 0), dtype=np.uint8),
+            np.zeros((50, 50, 3), dtype=np.uint8),
+            noise_array,
+            np.zeros((50, 50, 3), dtype=np.uint8),
+            gradient_array,
+        ]
+        results = sanitize_batch(images, jpeg_quality=(q, q))
+        for image, result in zip(images, results):
+            expected = sanitize(image, jpeg_quality=(q, q))
+            np.testing.assert_array_equal(result, expected)
+
+    def test_empty_batch(self) -> None:
+        assert sanitize_batch([]) == []
+
+    def test_options_forwarded(self, noise_bytes: bytes) -> None:
+        options = {"preset": "fast", "bit_depth": 4, "jpeg_quality": (80, 80)}
+        (result,) = sanitize_batch([noise_bytes], **options)
+        np.testing.assert_array_equal(result, sanitize(noise_bytes, **options))
+
+    def test_invalid_preset_raises(self, noise_bytes: bytes) -> None:
+        with pytest.raises(ValueError, match="Unknown preset"):
+            sanitize_batch([noise_bytes], preset="nonexistent")
+
+    def test_failure_reports_index(self, noise_bytes: bytes) -> None:
+        with pytest.raises(RuntimeError, match="image 1"):
+            sanitize_batch([noise_bytes, b"\x00\x01\x02\x03" * 10])
+
+    def test_native_bad_item_reports_index(self, noise_bytes: bytes) -> None:
+        from pixmask.pixmask_ext import sanitize_batch as native_batch
+
+        with pytest.raises(TypeError, match="image 1: expected bytes"):
+            native_batch([noise_bytes, 1])
+
+
 # ---------------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------------
@@ -208,3 +356,18 @@ class TestOutputValidity:
         result = sanitize(noise_bytes)
         assert result.min() >= 0
         assert result.max() <= 255
+
+
+# ---------------------------------------------------------------------------
+# Import cost
+# ---------------------------------------------------------------------------
+
+
+class TestImport:
+    """``import pixmask`` stays cheap."""
+
+    def test_import_defers_numpy(self) -> None:
+        code = "import sys, pixmask; sys.exit('numpy' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        proc = subprocess.run([sys.executable, "-c", code], env=env)
+        assert proc.returncode == 0